@@ -0,0 +1,7 @@
+"""
+Entry point for running the project directory or the talentscout.pyz launcher
+"""
+
+from run_app import main
+
+main()
@@ -4,10 +4,13 @@ TalentScout Hiring Assistant - Streamlit Application
 
 import streamlit as st
 import os
-from datetime import datetime
+from itertools import islice
 from chatbot import HiringAssistantChatbot, ConversationStage
 from data_handler import DataHandler
 
+# Number of most recent chat messages rendered on each rerun
+CHAT_RENDER_WINDOW = 50
+
 # Page configuration
 st.set_page_config(
     page_title="TalentScout Hiring Assistant",
@@ -16,8 +19,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better UI
-st.markdown("""
+@st.cache_data
+def _get_css():
+    """Get the custom CSS for better UI"""
+    return """
 <style>
     .main-header {
         text-align: center;
@@ -30,21 +35,6 @@ st.markdown("""
         border-radius: 10px;
         margin: 1rem 0;
     }
-    .user-message {
-        background-color: #007bff;
-        color: white;
-        padding: 0.5rem 1rem;
-        border-radius: 15px;
-        margin: 0.5rem 0;
-        text-align: right;
-    }
-    .bot-message {
-        background-color: #e9ecef;
-        color: #333;
-        padding: 0.5rem 1rem;
-        border-radius: 15px;
-        margin: 0.5rem 0;
-    }
     .status-info {
         background-color: #d4edda;
         border: 1px solid #c3e6cb;
@@ -62,21 +52,30 @@ st.markdown("""
         margin: 1rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def get_data_handler():
+    """Get the process-wide data handler shared by all sessions"""
+    return DataHandler.instance()
+
+@st.cache_data(ttl=60)
+def _load_candidates(limit=10):
+    """Load the candidate count and most recent records, cached until the next save or TTL expiry"""
+    data_handler = get_data_handler()
+    return data_handler.count_candidates(), data_handler.get_recent_candidates(limit)
 
 def initialize_session_state():
     """Initialize Streamlit session state variables"""
     if 'chatbot' not in st.session_state:
-        st.session_state.chatbot = HiringAssistantChatbot()
+        st.session_state.chatbot = HiringAssistantChatbot(data_handler=get_data_handler())
     
     if 'conversation_started' not in st.session_state:
         st.session_state.conversation_started = False
     
     if 'conversation_ended' not in st.session_state:
         st.session_state.conversation_ended = False
-    
-    if 'messages' not in st.session_state:
-        st.session_state.messages = []
+
 
 def display_header():
     """Display application header"""
@@ -128,10 +127,9 @@ def display_sidebar():
         
         # Control buttons
         if st.button("🔄 Start New Conversation"):
-            st.session_state.chatbot = HiringAssistantChatbot()
+            st.session_state.chatbot = HiringAssistantChatbot(data_handler=get_data_handler())
             st.session_state.conversation_started = False
             st.session_state.conversation_ended = False
-            st.session_state.messages = []
             st.rerun()
         
         if st.button("📋 View Candidate Info"):
@@ -146,7 +144,7 @@ def display_sidebar():
 
 def display_candidate_info():
     """Display current candidate information"""
-    candidate_info = st.session_state.chatbot.candidate_info.to_dict()
+    candidate_info = st.session_state.chatbot.candidate_info.as_view()
     
     st.subheader("Current Candidate Information")
     
@@ -165,16 +163,15 @@ def display_candidate_info():
 
 def display_all_candidates():
     """Display all candidate records"""
-    data_handler = DataHandler()
-    candidates = data_handler.get_all_candidates()
+    total, candidates = _load_candidates()
     
-    st.subheader(f"All Candidates ({len(candidates)} total)")
+    st.subheader(f"All Candidates ({total} total)")
     
     if not candidates:
         st.info("No candidate records found.")
         return
     
-    for i, candidate in enumerate(candidates[-10:], 1):  # Show last 10 candidates
+    for i, candidate in enumerate(candidates, 1):  # Last 10 candidates
         with st.expander(f"Candidate {i}: {candidate.get('full_name', 'Unknown')}"):
             st.write(f"**Email:** {candidate.get('email', 'N/A')}")
             st.write(f"**Experience:** {candidate.get('experience_years', 0)} years")
@@ -182,18 +179,25 @@ def display_all_candidates():
             st.write(f"**Tech Stack:** {', '.join(candidate.get('tech_stack', []))}")
             st.write(f"**Timestamp:** {candidate.get('timestamp', 'N/A')}")
 
+def display_message(message):
+    """Display a single chat message"""
+    with st.chat_message(message['role'], avatar="👤" if message['role'] == 'user' else "🤖"):
+        st.markdown(message['content'])
+
 def display_chat_interface():
     """Display main chat interface"""
     # Chat container
     chat_container = st.container()
     
     with chat_container:
-        # Display conversation history
-        for message in st.session_state.messages:
-            if message['role'] == 'user':
-                st.markdown(f'<div class="user-message">👤 {message["content"]}</div>', unsafe_allow_html=True)
-            else:
-                st.markdown(f'<div class="bot-message">🤖 {message["content"]}</div>', unsafe_allow_html=True)
+        # Display conversation history, keeping older messages behind a toggle
+        messages = st.session_state.chatbot.conversation_history
+        older_count = max(len(messages) - CHAT_RENDER_WINDOW, 0)
+        if older_count and st.toggle(f"Show {older_count} earlier messages", key="show_earlier_messages"):
+            for message in islice(messages, older_count):
+                display_message(message)
+        for message in islice(messages, older_count, None):
+            display_message(message)
     
     # Input area
     st.markdown("---")
@@ -202,10 +206,9 @@ def display_chat_interface():
     if st.session_state.conversation_ended:
         st.success("✅ Conversation completed! Thank you for using TalentScout Hiring Assistant.")
         if st.button("Start New Conversation"):
-            st.session_state.chatbot = HiringAssistantChatbot()
+            st.session_state.chatbot = HiringAssistantChatbot(data_handler=get_data_handler())
             st.session_state.conversation_started = False
             st.session_state.conversation_ended = False
-            st.session_state.messages = []
             st.rerun()
         return
     
@@ -214,12 +217,7 @@ def display_chat_interface():
         if st.button("🚀 Start Screening Process", type="primary"):
             st.session_state.conversation_started = True
             # Get initial greeting
-            greeting, _ = st.session_state.chatbot.process_message("")
-            st.session_state.messages.append({
-                'role': 'assistant',
-                'content': greeting,
-                'timestamp': datetime.now().isoformat()
-            })
+            st.session_state.chatbot.process_message("")
             st.rerun()
         return
     
@@ -227,22 +225,12 @@ def display_chat_interface():
     user_input = st.chat_input("Type your response here...")
     
     if user_input:
-        # Add user message to display
-        st.session_state.messages.append({
-            'role': 'user',
-            'content': user_input,
-            'timestamp': datetime.now().isoformat()
-        })
+        # Process message with chatbot; both turns are recorded in its history
+        _, conversation_ended = st.session_state.chatbot.process_message(user_input)
         
-        # Process message with chatbot
-        response, conversation_ended = st.session_state.chatbot.process_message(user_input)
-        
-        # Add bot response to display
-        st.session_state.messages.append({
-            'role': 'assistant',
-            'content': response,
-            'timestamp': datetime.now().isoformat()
-        })
+        # Candidate data is saved on conclusion and on ending
+        if conversation_ended or st.session_state.chatbot.current_stage == ConversationStage.CONCLUSION:
+            _load_candidates.clear()
         
         # Update conversation status
         if conversation_ended:
@@ -277,6 +265,9 @@ def display_instructions():
 
 def main():
     """Main application function"""
+    # Apply custom styling
+    st.markdown(_get_css(), unsafe_allow_html=True)
+    
     # Initialize session state
     initialize_session_state()
     
@@ -3,11 +3,41 @@ Core chatbot logic for TalentScout Hiring Assistant
 """
 
 import re
+import time
+import uuid
+from collections import deque
 from typing import Dict, List, Tuple, Optional
 from enum import Enum
-from prompts import PromptTemplates, PromptBuilder
-from tech_questions import TechQuestionGenerator
 from data_handler import CandidateInfo, DataHandler
+from prompts import PromptBuilder, PromptHistory
+
+# Precompiled patterns used by the input extractors
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_NON_DIGIT_RE = re.compile(r'\D')
+_DIGITS_RE = re.compile(r'\d+')
+# One or two leading words of Unicode letters, apostrophes and hyphens;
+# capitalisation is checked by _extract_name since `re` has no uppercase class
+_NAME_RE = re.compile(
+    r"^\s*([^\W\d_](?:[^\W\d_]|['-])+)(?![^\W\d_]|['-])"
+    r"(?:\s+([^\W\d_](?:[^\W\d_]|['-])+)(?![^\W\d_]|['-]))?"
+)
+_TECH_SPLIT_RE = re.compile(r'[,;|\n]|\s+and\s+|\s*&\s*')
+
+# Maximum number of messages kept in the conversation history
+_MAX_HISTORY_LENGTH = 200
+
+# Number of messages processed between automatic session saves
+_AUTOSAVE_INTERVAL = 5
+
+# Conversation ending keywords
+_ENDING_KEYWORDS = frozenset({
+    'goodbye', 'bye', 'exit', 'quit', 'end', 'stop',
+    'thanks', 'thank you', 'done', 'finish', 'complete'
+})
+_ENDING_RE = re.compile(
+    r'\b(?:' + '|'.join(sorted(map(re.escape, _ENDING_KEYWORDS), key=lambda k: (-len(k), k))) + r')\b',
+    re.IGNORECASE
+)
 
 class ConversationStage(Enum):
     """Enumeration of conversation stages"""
@@ -20,19 +50,52 @@ class ConversationStage(Enum):
 class HiringAssistantChatbot:
     """Main chatbot class for handling hiring conversations"""
     
-    def __init__(self):
-        self.conversation_history = []
+    # Ordered information collection steps:
+    # (candidate attribute, extractor method, success message, retry message)
+    _INFO_STEPS = (
+        ('email', '_extract_email',
+         "Perfect! Now, could you please provide your phone number?",
+         "I need a valid email address. Could you please provide your email?"),
+        ('phone', '_extract_phone',
+         "Great! How many years of professional experience do you have?",
+         "Please provide a valid phone number."),
+        ('experience_years', '_extract_years',
+         "Excellent! What position(s) are you interested in applying for?",
+         "Please provide your years of experience as a number (e.g., 3, 5, 10)."),
+        ('desired_position', '_extract_text',
+         "Thank you! What's your current location (city, state/country)?",
+         "Could you please tell me which position(s) you're interested in?"),
+        ('location', '_extract_text',
+         "Almost done! Please list your tech stack - the programming languages, frameworks, databases, and tools you're proficient in. You can separate them with commas.",
+         "Could you please tell me your current location (city, state/country)?"),
+        ('tech_stack', '_extract_tech_stack',
+         "Perfect! I've recorded your tech stack: {value}. Let me prepare some technical questions for you.",
+         "Please provide your technical skills (e.g., Python, React, MySQL, Docker)."),
+    )
+    
+    def __init__(self, data_handler: Optional[DataHandler] = None):
+        self.session_id = uuid.uuid4().hex
+        self.conversation_history = deque(maxlen=_MAX_HISTORY_LENGTH)
+        self._prompt_history = PromptHistory()
         self.candidate_info = CandidateInfo()
         self.current_stage = ConversationStage.GREETING
         self.current_question_index = 0
         self.technical_questions = []
-        self.data_handler = DataHandler()
+        self._info_cursor = 0
+        self._cached_summary = None
+        self._summary_dirty = True
+        self._turns_since_save = 0
+        self._unsaved_messages = []  # Messages not yet appended to the saved session transcript
+        self._saved_message_count = 0
+        self.data_handler = data_handler or DataHandler.instance()
         
-        # Conversation ending keywords
-        self.ending_keywords = [
-            'goodbye', 'bye', 'exit', 'quit', 'end', 'stop', 
-            'thanks', 'thank you', 'done', 'finish', 'complete'
-        ]
+        # Message handlers for each conversation stage
+        self._stage_handlers = {
+            ConversationStage.GREETING: self._handle_greeting,
+            ConversationStage.COLLECTING_INFO: self._handle_info_collection,
+            ConversationStage.TECH_QUESTIONS: self._handle_tech_questions,
+            ConversationStage.CONCLUSION: self._handle_conclusion,
+        }
     
     def process_message(self, user_input: str) -> Tuple[str, bool]:
         """
@@ -44,39 +107,69 @@ class HiringAssistantChatbot:
         Returns:
             Tuple[str, bool]: (response_message, is_conversation_ended)
         """
-        # Add user message to history
-        self.conversation_history.append({
-            'role': 'user',
-            'content': user_input,
-            'timestamp': self._get_timestamp()
-        })
+        # Any message may change the conversation state
+        self._summary_dirty = True
+        previous_stage = self.current_stage
         
-        # Check for conversation ending
-        if self._is_ending_conversation(user_input):
-            response = self._handle_conversation_ending()
-            return response, True
+        # Add user message to history; empty input (such as the request
+        # for the opening greeting) is not recorded
+        has_input = bool(user_input.strip())
+        if has_input:
+            self._add_to_history('user', user_input)
         
-        # Process based on current stage
-        if self.current_stage == ConversationStage.GREETING:
-            response = self._handle_greeting(user_input)
-        elif self.current_stage == ConversationStage.COLLECTING_INFO:
-            response = self._handle_info_collection(user_input)
-        elif self.current_stage == ConversationStage.TECH_QUESTIONS:
-            response = self._handle_tech_questions(user_input)
-        elif self.current_stage == ConversationStage.CONCLUSION:
-            response = self._handle_conclusion(user_input)
+        # Check for conversation ending, otherwise process based on current stage
+        if has_input and self._is_ending_conversation(user_input):
+            response = self._handle_conversation_ending()
         else:
-            response = self._handle_fallback(user_input)
+            handler = self._stage_handlers.get(self.current_stage, self._handle_fallback)
+            response = handler(user_input)
         
         # Add bot response to history
-        self.conversation_history.append({
-            'role': 'assistant',
-            'content': response,
-            'timestamp': self._get_timestamp()
-        })
+        self._add_to_history('assistant', response)
+        
+        # Periodically save progress so an unfinished conversation is not lost,
+        # and always save once it winds down so the closing messages are kept
+        self._turns_since_save += 1
+        finishing = (self.current_stage != previous_stage
+                     and self.current_stage in (ConversationStage.CONCLUSION, ConversationStage.ENDED))
+        if finishing or self._turns_since_save >= _AUTOSAVE_INTERVAL:
+            self._save_session()
         
         return response, self.current_stage == ConversationStage.ENDED
     
+    def _save_session(self):
+        """Append unsaved messages to the stored session and refresh its metadata"""
+        message_count = self._saved_message_count + len(self._unsaved_messages)
+        if self.data_handler.save_session(
+            self.session_id,
+            self.candidate_info.to_dict(),
+            self._unsaved_messages,
+            message_count
+        ):
+            # Kept for the next save if they could not be appended
+            self._saved_message_count = message_count
+            self._unsaved_messages = []
+        self._turns_since_save = 0
+    
+    def _add_to_history(self, role: str, content: str):
+        """Record a message in the conversation history"""
+        message = {
+            'role': role,
+            'content': content,
+            'timestamp': self._get_timestamp()
+        }
+        self.conversation_history.append(message)
+        self._unsaved_messages.append(message)
+        self._prompt_history.add(role, content)
+    
+    def build_prompt_context(self) -> str:
+        """Build the context prompt for the current conversation state"""
+        return PromptBuilder.build_context_prompt(
+            self._prompt_history,
+            self.candidate_info,
+            self.current_stage.value
+        )
+    
     def _handle_greeting(self, user_input: str) -> str:
         """Handle initial greeting and start information collection"""
         if not user_input.strip():
@@ -93,11 +186,9 @@ class HiringAssistantChatbot:
     
     def _handle_info_collection(self, user_input: str) -> str:
         """Handle information collection phase"""
-        # Determine what information to collect next
-        missing_fields = self.candidate_info.get_missing_fields()
-        
-        if not missing_fields:
+        if self._info_cursor >= len(self._INFO_STEPS):
             # All info collected, move to technical questions
+            from tech_questions import TechQuestionGenerator
             self.current_stage = ConversationStage.TECH_QUESTIONS
             self.technical_questions = TechQuestionGenerator.generate_questions(
                 self.candidate_info.tech_stack, 
@@ -110,8 +201,8 @@ class HiringAssistantChatbot:
             else:
                 return self._move_to_conclusion()
         
-        # Process current input and ask for next missing field
-        return self._process_info_input(user_input, missing_fields)
+        # Process current input and ask for the next field
+        return self._process_info_input(user_input)
     
     def _handle_tech_questions(self, user_input: str) -> str:
         """Handle technical questions phase"""
@@ -121,10 +212,7 @@ class HiringAssistantChatbot:
         # Store the answer
         if self.current_question_index < len(self.technical_questions):
             question = self.technical_questions[self.current_question_index]
-            self.candidate_info.technical_answers[f"question_{self.current_question_index + 1}"] = {
-                'question': question,
-                'answer': user_input
-            }
+            self.candidate_info.add_technical_answer(question, user_input)
         
         # Move to next question
         self.current_question_index += 1
@@ -162,51 +250,20 @@ Here's what happens next:
 
 Have a great day and good luck with your job search!"""
     
-    def _process_info_input(self, user_input: str, missing_fields: List[str]) -> str:
-        """Process user input for information collection"""
-        next_field = missing_fields[0]
-        
-        if next_field == 'Email Address':
-            email = self._extract_email(user_input)
-            if email:
-                self.candidate_info.email = email
-                return "Perfect! Now, could you please provide your phone number?"
-            else:
-                return "I need a valid email address. Could you please provide your email?"
-        
-        elif next_field == 'Phone Number':
-            phone = self._extract_phone(user_input)
-            if phone:
-                self.candidate_info.phone = phone
-                return "Great! How many years of professional experience do you have?"
-            else:
-                return "Please provide a valid phone number."
-        
-        elif next_field == 'Years of Experience':
-            years = self._extract_years(user_input)
-            if years is not None:
-                self.candidate_info.experience_years = years
-                return "Excellent! What position(s) are you interested in applying for?"
-            else:
-                return "Please provide your years of experience as a number (e.g., 3, 5, 10)."
+    def _process_info_input(self, user_input: str) -> str:
+        """Process user input for the current information collection step"""
+        attr, extractor, success_msg, retry_msg = self._INFO_STEPS[self._info_cursor]
         
-        elif next_field == 'Desired Position':
-            self.candidate_info.desired_position = user_input.strip()
-            return "Thank you! What's your current location (city, state/country)?"
+        value = getattr(self, extractor)(user_input)
+        if value is None or value == []:
+            return retry_msg
         
-        elif next_field == 'Current Location':
-            self.candidate_info.location = user_input.strip()
-            return "Almost done! Please list your tech stack - the programming languages, frameworks, databases, and tools you're proficient in. You can separate them with commas."
+        setattr(self.candidate_info, attr, value)
+        self._info_cursor += 1
         
-        elif next_field == 'Tech Stack':
-            tech_stack = self._extract_tech_stack(user_input)
-            if tech_stack:
-                self.candidate_info.tech_stack = tech_stack
-                return f"Perfect! I've recorded your tech stack: {', '.join(tech_stack)}. Let me prepare some technical questions for you."
-            else:
-                return "Please provide your technical skills (e.g., Python, React, MySQL, Docker)."
-        
-        return "I didn't understand that. Could you please try again?"
+        if isinstance(value, list):
+            value = ', '.join(value)
+        return success_msg.format(value=value)
     
     def _move_to_conclusion(self) -> str:
         """Move conversation to conclusion stage"""
@@ -237,32 +294,28 @@ To get started, could you please tell me your full name?"""
     
     def _is_ending_conversation(self, user_input: str) -> bool:
         """Check if user wants to end conversation"""
-        user_input_lower = user_input.lower().strip()
-        return any(keyword in user_input_lower for keyword in self.ending_keywords)
+        return bool(_ENDING_RE.search(user_input))
     
     def _extract_name(self, text: str) -> Optional[str]:
         """Extract name from user input"""
-        # Simple name extraction - look for capitalized words
-        text = text.strip()
-        if len(text.split()) >= 2:
-            words = text.split()
-            # Check if it looks like a name (capitalized words)
-            if all(word[0].isupper() for word in words[:2] if word.isalpha()):
-                return ' '.join(words[:2])
-        elif len(text.split()) == 1 and text.isalpha() and text[0].isupper():
-            return text
-        return None
+        # Simple name extraction - one or two leading capitalized words
+        m = _NAME_RE.match(text)
+        if not m or not m.group(1)[0].isupper():
+            return None
+        first, second = m.groups()
+        if second is None:
+            return first
+        # A lowercase second word (as in "My name is ...") means this is not a name
+        return f"{first} {second}" if second[0].isupper() else None
     
     def _extract_email(self, text: str) -> Optional[str]:
         """Extract email from user input"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        match = re.search(email_pattern, text)
-        return match.group() if match else None
+        return m.group() if (m := _EMAIL_RE.search(text)) else None
     
     def _extract_phone(self, text: str) -> Optional[str]:
         """Extract phone number from user input"""
         # Remove all non-digit characters and check length
-        digits = re.sub(r'\D', '', text)
+        digits = _NON_DIGIT_RE.sub('', text)
         if 10 <= len(digits) <= 15:
             return text.strip()
         return None
@@ -270,45 +323,35 @@ To get started, could you please tell me your full name?"""
     def _extract_years(self, text: str) -> Optional[int]:
         """Extract years of experience from user input"""
         # Look for numbers in the text
-        numbers = re.findall(r'\d+', text)
-        if numbers:
-            years = int(numbers[0])
+        if (m := _DIGITS_RE.search(text)):
+            years = int(m.group())
             if 0 <= years <= 50:  # Reasonable range
                 return years
         return None
     
+    def _extract_text(self, text: str) -> Optional[str]:
+        """Extract a free-text answer from user input"""
+        return text.strip() or None
+    
     def _extract_tech_stack(self, text: str) -> List[str]:
         """Extract tech stack from user input"""
         # Split by common separators and clean up
-        separators = [',', ';', '|', '\n', ' and ', ' & ']
-        tech_list = [text]
-        
-        for sep in separators:
-            new_list = []
-            for item in tech_list:
-                new_list.extend(item.split(sep))
-            tech_list = new_list
-        
-        # Clean and filter
-        tech_stack = []
-        for tech in tech_list:
-            tech = tech.strip().lower()
-            if tech and len(tech) > 1:
-                tech_stack.append(tech)
-        
-        return tech_stack[:10]  # Limit to 10 technologies
+        parts = (part.strip().lower() for part in _TECH_SPLIT_RE.split(text))
+        return [tech for tech in parts if len(tech) > 1][:10]  # Limit to 10 technologies
     
-    def _get_timestamp(self) -> str:
-        """Get current timestamp"""
-        from datetime import datetime
-        return datetime.now().isoformat()
+    def _get_timestamp(self) -> float:
+        """Get current timestamp as seconds since the epoch"""
+        return time.time()
     
     def get_conversation_summary(self) -> Dict:
-        """Get summary of current conversation state"""
-        return {
-            'stage': self.current_stage.value,
-            'candidate_info': self.candidate_info.to_dict(),
-            'questions_asked': len(self.technical_questions),
-            'questions_answered': self.current_question_index,
-            'conversation_length': len(self.conversation_history)
-        }
\ No newline at end of file
+        """Get summary of current conversation state, rebuilt only after new messages"""
+        if self._summary_dirty:
+            self._cached_summary = {
+                'stage': self.current_stage.value,
+                'candidate_info': self.candidate_info.to_dict(),
+                'questions_asked': len(self.technical_questions),
+                'questions_answered': self.current_question_index,
+                'conversation_length': len(self.conversation_history)
+            }
+            self._summary_dirty = False
+        return self._cached_summary
\ No newline at end of file
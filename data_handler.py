@@ -2,28 +2,151 @@
 Data handling and storage for candidate information
 """
 
+import atexit
+import copy
+import itertools
 import json
+import logging
+import mmap
 import os
+import re
+import secrets
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library encoder
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # Fall back to a compiled regex alternation
+    ahocorasick = None
+
+try:
+    import fcntl
+except ImportError:  # Windows has no flock; writes are only locked between threads there
+    fcntl = None
+
+log = logging.getLogger(__name__)
+
+# Precompiled patterns used to mask personal information
+_NAME_INITIALS_RE = re.compile(r'\s*(\S)(?:.*\s(\S))?', re.DOTALL)
+_EMAIL_LOCAL_RE = re.compile(r'^([^@]{2})[^@]+(?=@)')
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# Replacement for terms redacted from free-text answers
+REDACTED = "[REDACTED]"
+
+# Seconds to wait for the candidate store lock before giving up
+LOCK_TIMEOUT = 10
+
+# Number of appended records between fsync calls on the log
+FSYNC_INTERVAL = 16
+
+# Number of appended records after which the log is folded into the snapshot
+COMPACT_INTERVAL = 256
+
+def _is_word_char(char: str) -> bool:
+    """Check for a character matched by the regex ``\\w`` class"""
+    return char.isalnum() or char == '_'
+
+def _json_dumps(data, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 encoded JSON"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+def _json_loads(data):
+    """Parse UTF-8 encoded JSON"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 class DataHandler:
-    """Handles candidate data storage and retrieval with privacy considerations"""
+    """Handles candidate data storage and retrieval with privacy considerations
+    
+    Candidates live in a JSON snapshot (``candidates.json``) plus an
+    append-only log of newer records (``candidates.jsonl``), so saving a
+    candidate never rewrites the existing data. A background thread folds
+    the log into the snapshot every ``COMPACT_INTERVAL`` appends.
+    """
     
-    def __init__(self, data_dir: str = "data", candidate_file: str = "candidates.json"):
+    # Shared handlers by (data_dir, candidate_file), see instance()
+    _INSTANCES: Dict[Tuple[str, str], 'DataHandler'] = {}
+    _INSTANCES_LOCK = threading.Lock()
+    
+    # Candidate files already checked for existence in this process
+    _VALIDATED_PATHS = set()
+    
+    def __init__(self, data_dir: str = "data", candidate_file: str = "candidates.json",
+                 redact_terms_file: str = "redact_terms.txt", pretty: bool = False):
         self.data_dir = data_dir
+        self.pretty = pretty  # Indent the snapshot for readability at the cost of size
         self.candidate_file = candidate_file
         self.file_path = os.path.join(data_dir, candidate_file)
+        self.log_path = os.path.splitext(self.file_path)[0] + '.jsonl'
+        self.lock_path = self.file_path + '.lock'
+        self.sessions_dir = os.path.join(data_dir, 'sessions')
+        self._cache = None  # (store stat key, parsed candidate records, records by ID)
+        self._log_file = None
+        self._unsynced_records = 0
+        self._thread_lock = threading.Lock()  # flock does not exclude threads sharing a handler on Windows
+        self._appends_since_compact = 0
+        self._compact_requested = threading.Event()
+        self._compactor = None
+        
+        # Anonymizers for each sensitive field
+        self._anonymizers = {
+            'full_name': self._anonymize_name,
+            'email': self._anonymize_email,
+            'phone': self._anonymize_phone,
+            'technical_answers': self._redact_answers,
+        }
         self._ensure_data_directory()
+        
+        # Matcher for client/company names to redact from free text
+        self._redactor = self._load_redactor(os.path.join(data_dir, redact_terms_file))
+    
+    @classmethod
+    def instance(cls, data_dir: str = "data", candidate_file: str = "candidates.json") -> 'DataHandler':
+        """
+        Get the shared handler for a data directory and candidate file
+        
+        Args:
+            data_dir (str): Directory holding the candidate files
+            candidate_file (str): Candidate snapshot file name
+            
+        Returns:
+            DataHandler: Handler created on first use and reused afterwards
+        """
+        key = (data_dir, candidate_file)
+        with cls._INSTANCES_LOCK:
+            handler = cls._INSTANCES.get(key)
+            if handler is None:
+                handler = cls._INSTANCES[key] = cls(data_dir, candidate_file)
+        return handler
     
     def _ensure_data_directory(self):
         """Create data directory if it doesn't exist"""
+        if self.file_path in self._VALIDATED_PATHS:
+            return
+        
         if not os.path.exists(self.data_dir):
             os.makedirs(self.data_dir)
         
         # Create empty candidates file if it doesn't exist
         if not os.path.exists(self.file_path):
-            self._save_data([])
+            with self._lock():
+                if not os.path.exists(self.file_path):
+                    self._save_data([])
+        
+        self._VALIDATED_PATHS.add(self.file_path)
     
     def save_candidate(self, candidate_data: Dict) -> bool:
         """
@@ -36,33 +159,172 @@ class DataHandler:
             bool: True if saved successfully, False otherwise
         """
         try:
-            # Add metadata
-            candidate_data['timestamp'] = datetime.now().isoformat()
-            candidate_data['id'] = self._generate_candidate_id()
-            
-            # Load existing data
-            existing_data = self._load_data()
-            
-            # Add new candidate
-            existing_data.append(candidate_data)
+            # Add metadata from a single clock read
+            timestamp_ns = time.time_ns()
+            candidate_data['timestamp'] = datetime.fromtimestamp(timestamp_ns / 1e9).isoformat(timespec='seconds')
+            candidate_data['id'] = self._generate_candidate_id(timestamp_ns)
             
-            # Save updated data
-            self._save_data(existing_data)
+            # Append the new candidate to the log
+            record = _json_dumps(candidate_data) + b'\n'
+            with self._lock():
+                store_key = self._store_key()
+                self._append_record(record)
+                
+                # Keep an up-to-date cache current instead of re-reading it;
+                # the decoded copy shares no objects with the caller's dict
+                cache = self._cache
+                if cache is not None and cache[0] == store_key:
+                    _, records, index = cache
+                    stored = _json_loads(record)
+                    records.append(stored)
+                    index.setdefault(stored['id'], stored)
+                    self._cache = (self._store_key(), records, index)
+                
+                self._appends_since_compact += 1
+                if self._appends_since_compact >= COMPACT_INTERVAL:
+                    self._appends_since_compact = 0
+                    self._request_compaction()
             
             return True
             
-        except Exception as e:
-            print(f"Error saving candidate data: {e}")
+        except Exception:
+            log.exception("Error saving candidate data")
             return False
     
+    def save_session(self, session_id: str, candidate_data: Dict, new_messages: List[Dict],
+                     message_count: int) -> bool:
+        """
+        Save an in-progress conversation so it survives a closed browser
+        
+        Session metadata and the transcript are stored separately
+        (``<session_id>.json`` and ``<session_id>.jsonl``) so listing
+        sessions never has to read transcripts. The metadata is rewritten
+        on each save while messages are only appended, so the transcript
+        stays complete however long the conversation runs.
+        
+        Args:
+            session_id (str): Conversation session ID
+            candidate_data (Dict): Candidate information dictionary
+            new_messages (List[Dict]): Conversation history entries since the previous save
+            message_count (int): Total number of messages in the conversation
+            
+        Returns:
+            bool: True once the new messages are appended, False otherwise;
+            a failed metadata write is only logged, as the next save
+            rewrites the metadata in full
+        """
+        base_path = os.path.join(self.sessions_dir, session_id)
+        try:
+            os.makedirs(self.sessions_dir, exist_ok=True)
+            transcript = b''.join(
+                _json_dumps(self._serialize_message(message)) + b'\n'
+                for message in new_messages
+            )
+            with open(base_path + '.jsonl', 'ab') as f:
+                f.write(transcript)
+        except Exception:
+            log.exception("Error saving transcript of session %s", session_id)
+            return False
+        
+        try:
+            metadata = {
+                'session_id': session_id,
+                'updated_at': datetime.now().isoformat(),
+                'message_count': message_count,
+                'candidate_info': candidate_data
+            }
+            self._write_atomic(base_path + '.json', _json_dumps(metadata, indent=True))
+        except Exception:
+            log.exception("Error saving metadata of session %s", session_id)
+        
+        return True
+    
+    def flush(self):
+        """Force appended candidate records to disk"""
+        if self._log_file is not None and not self._log_file.closed:
+            self._log_file.flush()
+            os.fsync(self._log_file.fileno())
+            self._unsynced_records = 0
+    
+    def close(self):
+        """Flush and close the candidate log"""
+        if self._log_file is not None and not self._log_file.closed:
+            self.flush()
+            self._log_file.close()
+        self._log_file = None
+    
+    def compact(self):
+        """Fold the append log into the snapshot and empty the log"""
+        with self._lock():
+            try:
+                if os.path.getsize(self.log_path) == 0:
+                    return
+            except FileNotFoundError:
+                return
+            
+            records, index = self._load_cache()
+            self._save_data(records)
+            # The new snapshot must be on disk before the records leave the log
+            self._fsync_directory(os.path.dirname(self.file_path) or '.')
+            # The log is opened for appending, so open handles carry on at the new end
+            os.truncate(self.log_path, 0)
+            self._unsynced_records = 0
+            self._cache = (self._store_key(), records, index)
+    
+    def _request_compaction(self):
+        """Wake the compactor thread, starting it on first use"""
+        if self._compactor is None:
+            self._compactor = threading.Thread(
+                target=self._run_compactor, name='candidate-compactor', daemon=True
+            )
+            self._compactor.start()
+        self._compact_requested.set()
+    
+    def _run_compactor(self):
+        """Compact the store whenever requested, off the saving thread"""
+        while True:
+            self._compact_requested.wait()
+            self._compact_requested.clear()
+            try:
+                self.compact()
+            except Exception:
+                log.exception("Error compacting candidate data")
+    
     def get_all_candidates(self) -> List[Dict]:
         """
         Retrieve all candidate records
         
+        The list is new but the records are shared with the handler's
+        cache so a full listing costs no copying; treat them as read-only
+        and ``copy.deepcopy`` any record that needs changing.
+        
         Returns:
             List[Dict]: List of all candidate records
         """
-        return self._load_data()
+        return list(self._load_data())
+    
+    def get_recent_candidates(self, n: int = 10) -> List[Dict]:
+        """
+        Retrieve the most recently saved candidate records
+        
+        Args:
+            n (int): Maximum number of records to return
+            
+        Returns:
+            List[Dict]: Up to n candidate records, oldest first
+        """
+        if n <= 0:
+            return []
+        return copy.deepcopy(self._load_data()[-n:])
+    
+    def count_candidates(self) -> int:
+        """
+        Count stored candidate records
+        
+        Returns:
+            int: Number of candidate records
+        """
+        return len(self._load_data())
     
     def get_candidate_by_id(self, candidate_id: str) -> Optional[Dict]:
         """
@@ -74,11 +336,7 @@ class DataHandler:
         Returns:
             Optional[Dict]: Candidate data if found, None otherwise
         """
-        candidates = self._load_data()
-        for candidate in candidates:
-            if candidate.get('id') == candidate_id:
-                return candidate
-        return None
+        return copy.deepcopy(self._load_cache()[1].get(candidate_id))
     
     def anonymize_candidate_data(self, candidate_data: Dict) -> Dict:
         """
@@ -90,61 +348,283 @@ class DataHandler:
         Returns:
             Dict: Anonymized candidate data
         """
-        anonymized = candidate_data.copy()
+        # Anonymize sensitive fields in a single pass over the record
+        funcs = self._anonymizers
+        return {
+            key: funcs[key](value) if key in funcs else value
+            for key, value in candidate_data.items()
+        }
+    
+    def anonymize_batch(self, records: List[Dict]) -> List[Dict]:
+        """
+        Anonymize a list of candidate records
         
-        # Anonymize sensitive fields
-        if 'full_name' in anonymized:
-            anonymized['full_name'] = self._anonymize_name(anonymized['full_name'])
+        Args:
+            records (List[Dict]): Original candidate records
+            
+        Returns:
+            List[Dict]: Anonymized candidate records
+        """
+        anonymize = self.anonymize_candidate_data
+        return [anonymize(record) for record in records]
+    
+    def _load_data(self) -> List[Dict]:
+        """Load candidate data from storage"""
+        return self._load_cache()[0]
+    
+    def _load_cache(self) -> Tuple[List[Dict], Dict[str, Dict]]:
+        """Get candidate records and their ID index, re-parsing only when the files changed"""
+        store_key = self._store_key()
+        cache = self._cache
+        if cache is not None and cache[0] == store_key:
+            return cache[1], cache[2]
         
-        if 'email' in anonymized:
-            anonymized['email'] = self._anonymize_email(anonymized['email'])
+        data = list(self._iter_candidates())
+        # Built in reverse so the earliest record wins for a duplicated ID
+        index = {c['id']: c for c in reversed(data) if 'id' in c}
+        self._cache = (store_key, data, index)
+        return data, index
+    
+    def _store_key(self) -> Tuple:
+        """Get the modification time and size of the snapshot and log files"""
+        key = []
+        for path in (self.file_path, self.log_path):
+            try:
+                st = os.stat(path)
+                key.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                key.append(None)
+        return tuple(key)
+    
+    def _iter_candidates(self) -> Iterator[Dict]:
+        """Iterate candidate records, parsing log lines lazily
         
-        if 'phone' in anonymized:
-            anonymized['phone'] = self._anonymize_phone(anonymized['phone'])
+        Log records already in the snapshot are skipped; they remain if a
+        compaction was interrupted between writing the snapshot and
+        truncating the log. Lines torn by a crashed writer are skipped with
+        a warning.
+        """
+        snapshot = self._load_snapshot()
+        yield from snapshot
         
-        return anonymized
+        snapshot_ids = None
+        for line in self._iter_log_lines():
+            if snapshot_ids is None:
+                snapshot_ids = {c.get('id') for c in snapshot}
+            try:
+                record = _json_loads(line)
+            except ValueError:
+                log.warning("Skipping unreadable record in %s", self.log_path)
+                continue
+            if record.get('id') not in snapshot_ids:
+                yield record
     
-    def _load_data(self) -> List[Dict]:
-        """Load candidate data from storage"""
+    def _load_snapshot(self) -> List[Dict]:
+        """Load candidate data from the JSON snapshot
+        
+        The snapshot is only ever replaced atomically, so a parse error
+        means real corruption and is raised rather than hidden.
+        """
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            with open(self.file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return []
+                # orjson parses straight from the page cache
+                if orjson is None:
+                    return _json_loads(f.read())
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+        except FileNotFoundError:
             return []
     
+    def _iter_log_lines(self) -> Iterator[bytes]:
+        """Iterate complete records in the append log, skipping a partially written last line"""
+        try:
+            with open(self.log_path, 'rb') as f:
+                for line in f:
+                    if line.endswith(b'\n') and line.strip():
+                        yield line
+        except FileNotFoundError:
+            return
+    
     def _save_data(self, data: List[Dict]):
-        """Save candidate data to storage"""
-        with open(self.file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        """Atomically replace the candidate snapshot; callers must hold the store lock"""
+        self._write_atomic(self.file_path, _json_dumps(data, indent=self.pretty))
+    
+    def _append_record(self, record: bytes):
+        """Append an encoded record to the log; callers must hold the store lock"""
+        if self._log_file is None:
+            self._log_file = open(self.log_path, 'ab')
+            atexit.register(self.close)
+            self._end_partial_line()
+        
+        # Written through to the OS straight away; fsync is batched
+        self._log_file.write(record)
+        self._log_file.flush()
+        self._unsynced_records += 1
+        if self._unsynced_records >= FSYNC_INTERVAL:
+            os.fsync(self._log_file.fileno())
+            self._unsynced_records = 0
+    
+    def _end_partial_line(self):
+        """Terminate a torn last record left by a crashed writer so appends start on a new line"""
+        size = os.fstat(self._log_file.fileno()).st_size
+        if size == 0:
+            return
+        with open(self.log_path, 'rb') as f:
+            f.seek(size - 1)
+            if f.read(1) == b'\n':
+                return
+        log.warning("Terminating partially written record at the end of %s", self.log_path)
+        self._log_file.write(b'\n')
+    
+    def _write_atomic(self, path: str, content: bytes):
+        """Write a file via a temporary file and rename so readers never see partial content"""
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    
+    def _fsync_directory(self, path: str):
+        """Make renames within a directory durable; a no-op where directories cannot be opened"""
+        if os.name == 'nt':
+            return
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    
+    def _serialize_message(self, message: Dict) -> Dict:
+        """Convert a history entry for storage, formatting epoch timestamps as ISO strings"""
+        timestamp = message.get('timestamp')
+        if isinstance(timestamp, (int, float)):
+            message = dict(message, timestamp=datetime.fromtimestamp(timestamp).isoformat())
+        return message
+    
+    @contextmanager
+    def _lock(self, timeout: float = LOCK_TIMEOUT):
+        """Hold an exclusive lock on the candidate store across threads and processes"""
+        if not self._thread_lock.acquire(timeout=timeout):
+            raise TimeoutError(f"Timed out waiting for lock on {self.lock_path}")
+        try:
+            if fcntl is None:
+                yield
+                return
+            
+            with open(self.lock_path, 'a') as lock_file:
+                deadline = time.monotonic() + timeout
+                while True:
+                    try:
+                        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        break
+                    except BlockingIOError:
+                        if time.monotonic() >= deadline:
+                            raise TimeoutError(f"Timed out waiting for lock on {self.lock_path}")
+                        time.sleep(0.05)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+        finally:
+            self._thread_lock.release()
+    
+    def _generate_candidate_id(self, timestamp_ns: int) -> str:
+        """Generate unique candidate ID that sorts by creation time"""
+        return f"CAND_{timestamp_ns // 1_000_000:012x}{secrets.token_hex(4)}"
+    
+    def _load_redactor(self, path: str):
+        """Build matchers for the terms listed one per line in the redaction file
+        
+        Returns an (automaton, pattern) pair, or None without terms; the
+        automaton is None when pyahocorasick is not installed.
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                terms = {line.strip().lower() for line in f if line.strip() and not line.startswith('#')}
+        except FileNotFoundError:
+            return None
+        
+        if not terms:
+            return None
+        
+        alternation = '|'.join(sorted(map(re.escape, terms), key=lambda t: (-len(t), t)))
+        pattern = re.compile(rf'(?<!\w)(?:{alternation})(?!\w)', re.IGNORECASE)
+        
+        automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for term in terms:
+                automaton.add_word(term, len(term))
+            automaton.make_automaton()
+        return automaton, pattern
+    
+    def _redact_freetext(self, text: str) -> str:
+        """Replace listed terms in free text with a redaction marker"""
+        redactor = self._redactor
+        if redactor is None or not text:
+            return text
+        
+        automaton, pattern = redactor
+        lowered = text.lower()
+        # Automaton offsets index the lowered text, so they only apply to
+        # the original when lowering kept its length (it does not for 'İ')
+        if automaton is None or len(lowered) != len(text):
+            return pattern.sub(REDACTED, text)
+        
+        # One automaton pass finds every term; keep the leftmost-longest
+        # non-overlapping matches that fall on word boundaries
+        spans = sorted(
+            ((end - length + 1, end + 1) for end, length in automaton.iter(lowered)),
+            key=lambda span: (span[0], -span[1])
+        )
+        
+        parts = []
+        last = 0
+        for start, end in spans:
+            if start < last:
+                continue
+            if (start and _is_word_char(lowered[start - 1])) or (end < len(lowered) and _is_word_char(lowered[end])):
+                continue
+            parts.append(text[last:start])
+            parts.append(REDACTED)
+            last = end
+        parts.append(text[last:])
+        
+        return ''.join(parts)
+    
+    def _redact_answers(self, answers):
+        """Redact listed terms from the answers to technical questions"""
+        if self._redactor is None:
+            return answers
+        
+        if isinstance(answers, dict):  # Legacy {"question_N": {...}} records
+            return {key: self._redact_answer(item) for key, item in answers.items()}
+        return [self._redact_answer(item) for item in answers]
     
-    def _generate_candidate_id(self) -> str:
-        """Generate unique candidate ID"""
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        return f"CAND_{timestamp}"
+    def _redact_answer(self, item: Dict) -> Dict:
+        """Redact listed terms from a single question/answer record"""
+        return dict(item, answer=self._redact_freetext(item.get('answer', '')))
     
     def _anonymize_name(self, name: str) -> str:
         """Anonymize candidate name"""
-        if not name:
+        m = _NAME_INITIALS_RE.match(name) if name else None
+        if not m:
             return name
         
-        parts = name.split()
-        if len(parts) == 1:
-            return f"{parts[0][0]}***"
-        else:
-            return f"{parts[0][0]}*** {parts[-1][0]}***"
+        first, last = m.groups()
+        return f"{first}*** {last}***" if last else f"{first}***"
     
     def _anonymize_email(self, email: str) -> str:
         """Anonymize email address"""
-        if not email or '@' not in email:
+        if not email:
             return email
         
-        local, domain = email.split('@', 1)
-        if len(local) <= 2:
-            anonymized_local = local
-        else:
-            anonymized_local = f"{local[:2]}***"
-        
-        return f"{anonymized_local}@{domain}"
+        # Mask all but the first two characters of the local part
+        return _EMAIL_LOCAL_RE.sub(r'\1***', email, count=1)
     
     def _anonymize_phone(self, phone: str) -> str:
         """Anonymize phone number"""
@@ -152,78 +632,98 @@ class DataHandler:
             return phone
         
         # Keep only last 4 digits visible
-        if len(phone) > 4:
-            return f"***-***-{phone[-4:]}"
+        digits = _NON_DIGIT_RE.sub('', phone)
+        if len(digits) > 4:
+            return f"***-***-{digits[-4:]}"
         else:
             return "***-***-****"
 
+# Process-wide source of CandidateInfo versions, so a version identifies one state of one instance
+_INFO_VERSIONS = itertools.count()
+
+
 class CandidateInfo:
     """Data class for candidate information structure"""
     
-    def __init__(self):
-        self.full_name = ""
-        self.email = ""
-        self.phone = ""
-        self.experience_years = 0
-        self.desired_position = ""
-        self.location = ""
-        self.tech_stack = []
-        self.technical_answers = {}
-    
-    def to_dict(self) -> Dict:
-        """Convert candidate info to dictionary"""
-        return {
-            'full_name': self.full_name,
-            'email': self.email,
-            'phone': self.phone,
-            'experience_years': self.experience_years,
-            'desired_position': self.desired_position,
-            'location': self.location,
-            'tech_stack': self.tech_stack,
-            'technical_answers': self.technical_answers
-        }
+    # Fields and their default factories, in storage order
+    _FIELDS = (
+        ('full_name', str),
+        ('email', str),
+        ('phone', str),
+        ('experience_years', int),
+        ('desired_position', str),
+        ('location', str),
+        ('tech_stack', list),
+        ('technical_answers', list),  # (question, answer) pairs in question order
+    )
+    
+    # `version` changes on every field assignment, letting callers cache derived
+    # text; weak references let such caches be keyed by instance
+    __slots__ = tuple(name for name, _ in _FIELDS) + ('version', '__weakref__')
+    
+    # Required fields in collection order: (attribute, display label)
+    _REQUIRED = (
+        ('full_name', 'Full Name'),
+        ('email', 'Email Address'),
+        ('phone', 'Phone Number'),
+        ('desired_position', 'Desired Position'),
+        ('location', 'Current Location'),
+        ('tech_stack', 'Tech Stack'),
+    )
+    
+    def __init__(self, **values):
+        for name, default in self._FIELDS:
+            setattr(self, name, values.pop(name) if name in values else default())
+        if values:
+            raise TypeError(f"Unknown candidate info fields: {', '.join(values)}")
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, 'version', next(_INFO_VERSIONS))
+    
+    def add_technical_answer(self, question: str, answer: str):
+        """Record an answer to a technical question"""
+        self.technical_answers.append((question, answer))
+        object.__setattr__(self, 'version', next(_INFO_VERSIONS))
     
-    def from_dict(self, data: Dict):
-        """Load candidate info from dictionary"""
-        self.full_name = data.get('full_name', '')
-        self.email = data.get('email', '')
-        self.phone = data.get('phone', '')
-        self.experience_years = data.get('experience_years', 0)
-        self.desired_position = data.get('desired_position', '')
-        self.location = data.get('location', '')
-        self.tech_stack = data.get('tech_stack', [])
-        self.technical_answers = data.get('technical_answers', {})
+    def as_view(self) -> Mapping:
+        """Get a read-only view of candidate info without copying field values"""
+        return MappingProxyType({name: getattr(self, name) for name, _ in self._FIELDS})
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'CandidateInfo':
+        """Create candidate info from dictionary"""
+        values = {name: data[name] for name, _ in cls._FIELDS if name in data}
+        
+        answers = values.get('technical_answers', [])
+        if isinstance(answers, dict):  # Legacy {"question_N": {...}} records
+            answers = answers.values()
+        values['technical_answers'] = [(item['question'], item['answer']) for item in answers]
+        
+        return cls(**values)
     
     def is_complete(self) -> bool:
         """Check if all required information is collected"""
-        required_fields = [
-            self.full_name,
-            self.email,
-            self.phone,
-            self.desired_position,
-            self.location,
-            self.tech_stack
-        ]
-        
-        return all(field for field in required_fields) and self.experience_years >= 0
+        return not self.get_missing_fields() and self.experience_years >= 0
     
     def get_missing_fields(self) -> List[str]:
         """Get list of missing required fields in order"""
-        missing = []
-        
-        if not self.full_name:
-            missing.append('Full Name')
-        elif not self.email:
-            missing.append('Email Address')
-        elif not self.phone:
-            missing.append('Phone Number')
-        elif self.experience_years < 0:
-            missing.append('Years of Experience')
-        elif not self.desired_position:
-            missing.append('Desired Position')
-        elif not self.location:
-            missing.append('Current Location')
-        elif not self.tech_stack:
-            missing.append('Tech Stack')
-            
-        return missing
\ No newline at end of file
+        return [label for attr, label in self._REQUIRED if not getattr(self, attr)]
+
+def _build_to_dict(cls):
+    """Generate ``to_dict`` for a fields table as a single inlined dict literal"""
+    # Storage form of fields whose in-memory form differs
+    exprs = {
+        'technical_answers': "[{'question': q, 'answer': a} for q, a in self.technical_answers]",
+    }
+    items = ', '.join(f"{name!r}: {exprs.get(name, 'self.' + name)}" for name, _ in cls._FIELDS)
+    namespace = {}
+    exec(f"def to_dict(self):\n    return {{{items}}}\n", namespace)
+    
+    to_dict = namespace['to_dict']
+    to_dict.__qualname__ = f"{cls.__name__}.to_dict"
+    to_dict.__doc__ = "Convert candidate info to dictionary"
+    to_dict.__annotations__ = {'return': Dict}
+    return to_dict
+
+CandidateInfo.to_dict = _build_to_dict(CandidateInfo)
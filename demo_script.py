@@ -53,7 +53,7 @@ def run_demo_conversation():
     for key, value in candidate_info.items():
         if key == 'technical_answers':
             print(f"\n📝 Technical Answers:")
-            for q_key, q_data in value.items():
+            for q_data in value:
                 print(f"   Q: {q_data['question']}")
                 print(f"   A: {q_data['answer'][:100]}...")
         else:
@@ -85,7 +85,7 @@ def test_data_handling():
     print("\n🔒 TESTING DATA HANDLING & PRIVACY")
     print("=" * 50)
     
-    data_handler = DataHandler()
+    data_handler = DataHandler.instance()
     
     # Test candidate data
     test_candidate = {
@@ -96,12 +96,12 @@ def test_data_handling():
         'desired_position': 'Frontend Developer',
         'location': 'New York, NY',
         'tech_stack': ['React', 'TypeScript', 'CSS'],
-        'technical_answers': {
-            'question_1': {
+        'technical_answers': [
+            {
                 'question': 'Explain React hooks',
                 'answer': 'React hooks allow functional components to use state and lifecycle methods...'
             }
-        }
+        ]
     }
     
     # Save candidate
@@ -4,11 +4,18 @@ Supports local and cloud deployment options
 """
 
 import os
+import py_compile
+import shutil
 import subprocess
 import sys
 import json
+import logging
+import tempfile
+import zipapp
 from pathlib import Path
 
+log = logging.getLogger(__name__)
+
 class DeploymentManager:
     """Manages deployment of the TalentScout Hiring Assistant"""
     
@@ -16,46 +23,47 @@ class DeploymentManager:
         self.project_root = Path.cwd()
         self.requirements_file = self.project_root / "requirements.txt"
         self.app_file = self.project_root / "app.py"
+        self.zipapp_file = self.project_root / "talentscout.pyz"
     
     def check_prerequisites(self):
         """Check if all prerequisites are met"""
-        print("🔍 Checking prerequisites...")
+        log.info("🔍 Checking prerequisites...")
         
         # Check Python version
         python_version = sys.version_info
         if python_version.major < 3 or (python_version.major == 3 and python_version.minor < 8):
-            print("❌ Python 3.8 or higher is required")
+            log.error("❌ Python 3.8 or higher is required")
             return False
-        print(f"✅ Python {python_version.major}.{python_version.minor}.{python_version.micro}")
+        log.info("✅ Python %s.%s.%s", python_version.major, python_version.minor, python_version.micro)
         
         # Check required files
         required_files = [self.requirements_file, self.app_file]
         for file_path in required_files:
             if not file_path.exists():
-                print(f"❌ Required file missing: {file_path}")
+                log.error("❌ Required file missing: %s", file_path)
                 return False
-        print("✅ All required files present")
+        log.info("✅ All required files present")
         
         return True
     
     def install_dependencies(self):
         """Install required dependencies"""
-        print("📦 Installing dependencies...")
+        log.info("📦 Installing dependencies...")
         
         try:
             subprocess.run([
                 sys.executable, "-m", "pip", "install", "-r", str(self.requirements_file)
             ], check=True, capture_output=True, text=True)
-            print("✅ Dependencies installed successfully")
+            log.info("✅ Dependencies installed successfully")
             return True
         except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to install dependencies: {e}")
-            print(f"Error output: {e.stderr}")
+            log.error("❌ Failed to install dependencies: %s", e)
+            log.error("Error output: %s", e.stderr)
             return False
     
     def setup_environment(self):
         """Set up environment configuration"""
-        print("⚙️ Setting up environment...")
+        log.info("⚙️ Setting up environment...")
         
         env_file = self.project_root / ".env"
         env_example = self.project_root / ".env.example"
@@ -66,31 +74,31 @@ class DeploymentManager:
                 content = example.read()
             with open(env_file, 'w') as env:
                 env.write(content)
-            print("📝 Created .env file from template")
+            log.info("📝 Created .env file from template")
         
         # Create data directory if it doesn't exist
         data_dir = self.project_root / "data"
         if not data_dir.exists():
             data_dir.mkdir()
-            print("📁 Created data directory")
+            log.info("📁 Created data directory")
         
         # Create empty candidates file if it doesn't exist
         candidates_file = data_dir / "candidates.json"
         if not candidates_file.exists():
             with open(candidates_file, 'w') as f:
                 json.dump([], f)
-            print("📄 Created candidates.json file")
+            log.info("📄 Created candidates.json file")
         
-        print("✅ Environment setup complete")
+        log.info("✅ Environment setup complete")
         return True
     
     def run_tests(self):
         """Run application tests"""
-        print("🧪 Running tests...")
+        log.info("🧪 Running tests...")
         
         test_file = self.project_root / "test_chatbot.py"
         if not test_file.exists():
-            print("⚠️ Test file not found, skipping tests")
+            log.warning("⚠️ Test file not found, skipping tests")
             return True
         
         try:
@@ -99,40 +107,56 @@ class DeploymentManager:
             ], capture_output=True, text=True)
             
             if result.returncode == 0:
-                print("✅ All tests passed")
+                log.info("✅ All tests passed")
                 return True
             else:
-                print("❌ Some tests failed")
-                print(result.stdout)
+                log.error("❌ Some tests failed")
+                log.error("%s", result.stdout)
                 return False
         except Exception as e:
-            print(f"⚠️ Could not run tests: {e}")
+            log.warning("⚠️ Could not run tests: %s", e)
             return True  # Don't fail deployment for test issues
     
     def deploy_local(self, port=8501):
         """Deploy application locally"""
-        print(f"🚀 Starting local deployment on port {port}...")
+        log.info("🚀 Starting local deployment on port %s...", port)
         
         try:
             # Run Streamlit app
             cmd = [sys.executable, "-m", "streamlit", "run", str(self.app_file), "--server.port", str(port)]
-            print(f"📱 Application will be available at: http://localhost:{port}")
-            print("🔗 Opening in your default browser...")
-            print("💡 Press Ctrl+C to stop the application")
+            log.info("📱 Application will be available at: http://localhost:%s", port)
+            log.info("🔗 Opening in your default browser...")
+            log.info("💡 Press Ctrl+C to stop the application")
             
-            subprocess.run(cmd)
+            if hasattr(os, "posix_spawnp"):
+                self._spawn_and_wait(cmd)
+            else:
+                subprocess.run(cmd)
             
         except KeyboardInterrupt:
-            print("\n👋 Application stopped by user")
+            log.info("\n👋 Application stopped by user")
         except Exception as e:
-            print(f"❌ Failed to start application: {e}")
+            log.error("❌ Failed to start application: %s", e)
             return False
         
         return True
     
+    def _spawn_and_wait(self, cmd):
+        """Run a command via posix_spawn, skipping subprocess's fork and descriptor-closing loop"""
+        pid = os.posix_spawnp(cmd[0], cmd, os.environ)
+        try:
+            _, status = os.waitpid(pid, 0)
+        except KeyboardInterrupt:
+            # Ctrl+C reached the child too; let it shut down before reporting
+            os.waitpid(pid, 0)
+            raise
+        
+        if os.WIFEXITED(status) and os.WEXITSTATUS(status):
+            log.error("❌ Application exited with status %s", os.WEXITSTATUS(status))
+    
     def generate_docker_files(self):
         """Generate Docker configuration files"""
-        print("🐳 Generating Docker configuration...")
+        log.info("🐳 Generating Docker configuration...")
         
         # Dockerfile
         dockerfile_content = """FROM python:3.9-slim
@@ -209,15 +233,15 @@ coverage.xml
         with open(".dockerignore", "w") as f:
             f.write(dockerignore_content)
         
-        print("✅ Docker files generated")
-        print("📝 To build and run with Docker:")
-        print("   docker-compose up --build")
+        log.info("✅ Docker files generated")
+        log.info("📝 To build and run with Docker:")
+        log.info("   docker-compose up --build")
         
         return True
     
     def generate_cloud_configs(self):
         """Generate cloud deployment configurations"""
-        print("☁️ Generating cloud deployment configurations...")
+        log.info("☁️ Generating cloud deployment configurations...")
         
         # Heroku Procfile
         with open("Procfile", "w") as f:
@@ -257,34 +281,61 @@ gatherUsageStats = false
         with open(config_dir / "config.toml", "w") as f:
             f.write(streamlit_config)
         
-        print("✅ Cloud deployment configurations generated")
-        print("📝 Deployment options:")
-        print("   • Heroku: Use Procfile")
-        print("   • Railway: Use railway.json")
-        print("   • Streamlit Cloud: Use .streamlit/config.toml")
+        log.info("✅ Cloud deployment configurations generated")
+        log.info("📝 Deployment options:")
+        log.info("   • Heroku: Use Procfile")
+        log.info("   • Railway: Use railway.json")
+        log.info("   • Streamlit Cloud: Use .streamlit/config.toml")
+        
+        return True
+
+    def build_zipapp(self):
+        """Bundle the launcher as a zipapp of precompiled bytecode"""
+        log.info("📦 Building launcher zipapp...")
+        
+        with tempfile.TemporaryDirectory() as staging:
+            staging = Path(staging)
+            # Sourceless .pyc files are imported straight from the archive
+            py_compile.compile(
+                str(self.project_root / "run_app.py"),
+                cfile=str(staging / "run_app.pyc"),
+                doraise=True
+            )
+            # zipapp needs the entry point as source; it is only a two-line stub
+            shutil.copyfile(self.project_root / "__main__.py", staging / "__main__.py")
+            
+            zipapp.create_archive(
+                staging,
+                target=self.zipapp_file,
+                interpreter="/usr/bin/env python3"
+            )
+        
+        log.info("✅ Created %s", self.zipapp_file.name)
+        log.info("📝 Run it from the project directory with the same Python version:")
+        log.info("   python %s", self.zipapp_file.name)
         
         return True
 
 def main():
     """Main deployment function"""
-    print("🎯 TalentScout Hiring Assistant - Deployment Manager")
-    print("=" * 60)
+    log.info("🎯 TalentScout Hiring Assistant - Deployment Manager")
+    log.info("=" * 60)
     
     deployment = DeploymentManager()
     
     # Check prerequisites
     if not deployment.check_prerequisites():
-        print("❌ Prerequisites not met. Please fix the issues and try again.")
+        log.error("❌ Prerequisites not met. Please fix the issues and try again.")
         return False
     
     # Install dependencies
     if not deployment.install_dependencies():
-        print("❌ Failed to install dependencies.")
+        log.error("❌ Failed to install dependencies.")
         return False
     
     # Setup environment
     if not deployment.setup_environment():
-        print("❌ Failed to setup environment.")
+        log.error("❌ Failed to setup environment.")
         return False
     
     # Run tests
@@ -296,9 +347,10 @@ def main():
     print("2. Generate Docker files")
     print("3. Generate cloud deployment configs")
     print("4. All of the above")
+    print("5. Build launcher zipapp (talentscout.pyz)")
     
     try:
-        choice = input("\nEnter your choice (1-4): ").strip()
+        choice = input("\nEnter your choice (1-5): ").strip()
         
         if choice == "1":
             deployment.deploy_local()
@@ -309,22 +361,25 @@ def main():
         elif choice == "4":
             deployment.generate_docker_files()
             deployment.generate_cloud_configs()
-            print("\n🎉 All configurations generated!")
-            print("To start locally, run: python deploy.py and choose option 1")
+            log.info("\n🎉 All configurations generated!")
+            log.info("To start locally, run: python deploy.py and choose option 1")
+        elif choice == "5":
+            deployment.build_zipapp()
         else:
-            print("❌ Invalid choice. Please run the script again.")
+            log.error("❌ Invalid choice. Please run the script again.")
             return False
         
-        print("\n✅ Deployment process completed successfully!")
+        log.info("\n✅ Deployment process completed successfully!")
         return True
         
     except KeyboardInterrupt:
-        print("\n👋 Deployment cancelled by user")
+        log.info("\n👋 Deployment cancelled by user")
         return False
     except Exception as e:
-        print(f"❌ Deployment failed: {e}")
+        log.error("❌ Deployment failed: %s", e)
         return False
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     success = main()
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -2,9 +2,23 @@
 Prompt templates and engineering for the TalentScout Hiring Assistant
 """
 
+import sys
+import textwrap
+import weakref
+from collections import deque
+from itertools import islice
+
+# Display labels for candidate info keys in prompt context
+_LABEL = {
+    key: key.replace('_', ' ').title()
+    for key in ('full_name', 'email', 'phone', 'experience_years', 'desired_position',
+                'location', 'tech_stack', 'technical_answers')
+}
+
 class PromptTemplates:
+    """Prompt texts, dedented and interned once at import"""
     
-    SYSTEM_PROMPT = """
+    SYSTEM_PROMPT = sys.intern(textwrap.dedent("""
     You are a professional Hiring Assistant chatbot for TalentScout, a technology recruitment agency. 
     Your role is to conduct initial candidate screening in a friendly, professional manner.
     
@@ -30,15 +44,15 @@ class PromptTemplates:
     - Stay focused on hiring-related topics
     - End conversation when user says goodbye, exit, quit, or similar
     - If user provides irrelevant information, politely redirect to hiring topics
-    """
+    """).strip())
     
-    GREETING_PROMPT = """
+    GREETING_PROMPT = sys.intern(textwrap.dedent("""
     Greet the candidate warmly and introduce yourself as TalentScout's Hiring Assistant. 
     Explain that you'll help with their initial screening by gathering some information and 
     asking relevant technical questions. Ask for their full name to begin.
-    """
+    """).strip())
     
-    INFO_GATHERING_PROMPT = """
+    INFO_GATHERING_PROMPT = sys.intern(textwrap.dedent("""
     Based on the conversation history, determine what information is still needed:
     - Full Name
     - Email Address  
@@ -50,9 +64,9 @@ class PromptTemplates:
     
     Ask for the next missing piece of information in a natural, conversational way.
     If all information is collected, proceed to generate technical questions.
-    """
+    """).strip())
     
-    TECH_QUESTION_PROMPT = """
+    TECH_QUESTION_PROMPT = sys.intern(textwrap.dedent("""
     Based on the candidate's tech stack: {tech_stack}
     
     Generate 3-5 relevant technical questions that assess their proficiency in the technologies they mentioned.
@@ -66,25 +80,29 @@ class PromptTemplates:
     - Real-world experience
     
     Start with the first question.
-    """
+    """).strip())
     
-    FALLBACK_PROMPT = """
+    FALLBACK_PROMPT = sys.intern(textwrap.dedent("""
     The user provided input that doesn't seem related to the hiring process or is unclear.
     Politely acknowledge their input and redirect the conversation back to the hiring screening.
     If they seem to want to end the conversation, ask for confirmation.
-    """
+    """).strip())
     
-    CONCLUSION_PROMPT = """
+    CONCLUSION_PROMPT = sys.intern(textwrap.dedent("""
     Thank the candidate for their time and information. Let them know:
     1. Their information has been recorded
     2. The recruitment team will review their responses
     3. They will be contacted within 2-3 business days
     4. Provide a professional closing
-    """
+    """).strip())
 
 class PromptBuilder:
     """Helper class to build dynamic prompts based on conversation state"""
     
+    # Most recent messages, and characters of each, included as context
+    HISTORY_WINDOW = 5
+    HISTORY_CONTENT_LIMIT = 200
+    
     @staticmethod
     def build_context_prompt(conversation_history, candidate_info, current_stage):
         """Build a context-aware prompt based on current conversation state"""
@@ -103,27 +121,71 @@ class PromptBuilder:
         
         return context
     
-    @staticmethod
-    def _format_candidate_info(info):
-        """Format candidate information for prompt context"""
+    # Rendered candidate info per CandidateInfo instance: (state key, text)
+    _info_cache = weakref.WeakKeyDictionary()
+    
+    # Pre-uppercased role labels for history lines
+    _ROLE_LABELS = {'user': 'USER', 'assistant': 'ASSISTANT'}
+    
+    @classmethod
+    def _format_candidate_info(cls, info):
+        """Format candidate information for prompt context
+        
+        Accepts a plain dict or a CandidateInfo; the latter is only re-rendered
+        when its state changes. Its version covers field assignments, and the
+        list fields are compared by content since in-place edits leave the
+        version alone.
+        """
+        candidate = None
+        if getattr(info, 'version', None) is not None:
+            candidate = info
+            state = (info.version, tuple(info.tech_stack), tuple(info.technical_answers))
+            cached = cls._info_cache.get(candidate)
+            if cached is not None and cached[0] == state:
+                return cached[1]
+            info = info.to_dict()
+        
         formatted = []
         for key, value in info.items():
-            if value:
-                formatted.append(f"- {key.replace('_', ' ').title()}: {value}")
-            else:
-                formatted.append(f"- {key.replace('_', ' ').title()}: [NOT COLLECTED]")
-        return "\n".join(formatted)
+            label = _LABEL.get(key) or key.replace('_', ' ').title()
+            formatted.append(f"- {label}: {value if value else '[NOT COLLECTED]'}")
+        text = "\n".join(formatted)
+        
+        if candidate is not None:
+            cls._info_cache[candidate] = (state, text)
+        return text
     
-    @staticmethod
-    def _format_conversation_history(history):
-        """Format conversation history for prompt context"""
+    @classmethod
+    def _format_conversation_history(cls, history):
+        """Format conversation history for prompt context
+        
+        A PromptHistory is already windowed and truncated and is used as is;
+        any other sequence of message dicts is cut down here.
+        """
         if not history:
             return "No previous conversation"
         
+        if isinstance(history, PromptHistory):
+            entries = history
+        else:
+            # islice rather than slicing, so the chatbot's deque history works too
+            recent = islice(history, max(len(history) - cls.HISTORY_WINDOW, 0), None)
+            limit = cls.HISTORY_CONTENT_LIMIT
+            entries = ((m.get('role', 'unknown'), m.get('content', '')[:limit]) for m in recent)
+        
         formatted = []
-        for i, message in enumerate(history[-5:]):  # Last 5 messages for context
-            role = message.get('role', 'unknown')
-            content = message.get('content', '')[:200]  # Truncate long messages
-            formatted.append(f"{i+1}. {role.upper()}: {content}")
+        for i, (role, content) in enumerate(entries, 1):
+            label = cls._ROLE_LABELS.get(role) or role.upper()
+            formatted.append("%d. %s: %s" % (i, label, content))
         
-        return "\n".join(formatted)
\ No newline at end of file
+        return "\n".join(formatted)
+
+class PromptHistory(deque):
+    """Recent (role, content) pairs for prompt context, windowed and truncated as they are added"""
+    
+    def __init__(self):
+        super().__init__(maxlen=PromptBuilder.HISTORY_WINDOW)
+    
+    def add(self, role: str, content: str):
+        """Record a message, keeping only the start of long content"""
+        self.append((role, content[:PromptBuilder.HISTORY_CONTENT_LIMIT]))
\ No newline at end of file
@@ -2,56 +2,130 @@
 Simple script to run the TalentScout Hiring Assistant
 """
 
-import subprocess
-import sys
+import functools
 import os
+import runpy
+import shutil
+import sys
+from importlib.util import find_spec
+
+# Console banners, each written in one piece
+_HEADER = "🤖 TalentScout Hiring Assistant\n" + "=" * 40 + "\n"
+_LAUNCH_BANNER = (
+    "🚀 Starting TalentScout Hiring Assistant...\n"
+    "📱 The application will open in your default browser\n"
+    "🔗 URL: http://localhost:8501\n"
+    "\n💡 To stop the application, press Ctrl+C in this terminal\n"
+    + "=" * 40 + "\n"
+)
 
 def check_requirements():
     """Check if required packages are installed"""
+    # Only locate the packages; importing them would load Streamlit's whole stack for nothing
+    missing = [name for name in ("streamlit", "openai") if find_spec(name) is None]
+    if missing:
+        print(f"❌ Missing required package(s): {', '.join(missing)}")
+        print("Please run: pip install -r requirements.txt")
+        return False
+    
+    print("✅ All required packages are installed")
+    return True
+
+@functools.lru_cache(maxsize=1)
+def _ensure_env():
+    """Create .env from .env.example if it is missing; True if a .env file is in place"""
     try:
-        import streamlit
-        import openai
-        print("✅ All required packages are installed")
+        os.stat('.env')
         return True
-    except ImportError as e:
-        print(f"❌ Missing required package: {e}")
-        print("Please run: pip install -r requirements.txt")
+    except FileNotFoundError:
+        pass
+    
+    print("⚠️  No .env file found. Creating from template...")
+    try:
+        shutil.copyfile('.env.example', '.env')
+    except FileNotFoundError:
+        return False
+    print("📝 Created .env file. Please add your OpenAI API key if needed.")
+    return True
+
+def _precompile_pandas():
+    """Import pandas in a detached process if its bytecode cache is missing
+    
+    Streamlit imports pandas on boot; in a fresh environment that import
+    first compiles hundreds of modules. Importing it in parallel with the
+    Streamlit boot compiles just the modules an import needs and leaves
+    their .pyc files on disk for Streamlit to load.
+    """
+    if sys.dont_write_bytecode:  # The import would leave nothing behind
+        return
+    spec = find_spec("pandas")
+    if spec is None or not spec.origin or not spec.cached or os.path.exists(spec.cached):
+        return
+    package_dir = os.path.dirname(spec.origin)
+    if not os.access(package_dir, os.W_OK):
+        return
+    
+    # The shell backgrounds the import and exits at once, so the import is
+    # reparented instead of lingering as a child of the exec'd Streamlit
+    script = 'exec "$0" -c "import pandas" </dev/null >/dev/null 2>&1 &'
+    try:
+        pid = os.posix_spawnp("sh", ["sh", "-c", script, sys.executable], os.environ)
+        os.waitpid(pid, 0)
+    except OSError:
+        pass  # Only a warm-up; Streamlit compiles on import regardless
+
+def _inside_streamlit():
+    """Check whether this script is itself being run by Streamlit"""
+    # Plain `python run_app.py` never loads the script runner
+    if "streamlit.runtime.scriptrunner" not in sys.modules:
         return False
+    from streamlit import runtime
+    return runtime.exists()
 
 def main():
     """Main function to run the application"""
-    print("🤖 TalentScout Hiring Assistant")
-    print("=" * 40)
+    # `streamlit run run_app.py` would otherwise start a second Streamlit
+    # Runs the whole page as its own script, page config included, on every rerun
+    if _inside_streamlit():
+        runpy.run_path(os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py"),
+                       run_name="__main__")
+        return
+    
+    sys.stdout.write(_HEADER)
     
     # Check if requirements are met
     if not check_requirements():
         return
     
-    # Check if .env file exists
-    if not os.path.exists('.env'):
-        print("⚠️  No .env file found. Creating from template...")
-        if os.path.exists('.env.example'):
-            with open('.env.example', 'r') as example:
-                content = example.read()
-            with open('.env', 'w') as env_file:
-                env_file.write(content)
-            print("📝 Created .env file. Please add your OpenAI API key if needed.")
-    
-    print("🚀 Starting TalentScout Hiring Assistant...")
-    print("📱 The application will open in your default browser")
-    print("🔗 URL: http://localhost:8501")
-    print("\n💡 To stop the application, press Ctrl+C in this terminal")
-    print("=" * 40)
+    # Make sure a .env file exists
+    _ensure_env()
+    
+    sys.stdout.write(_LAUNCH_BANNER)
+    sys.stdout.flush()  # Must reach the terminal before exec replaces this process
+    
+    cmd = [sys.executable, "-m", "streamlit", "run", "app.py"]
+    
+    if os.name == 'nt':
+        # Windows has no real exec, so wait on Streamlit as a child process
+        import subprocess
+        try:
+            subprocess.run(cmd, check=True)
+        except KeyboardInterrupt:
+            print("\n👋 Application stopped by user")
+        except subprocess.CalledProcessError as e:
+            print(f"❌ Error running application: {e}")
+        except Exception as e:
+            print(f"❌ Unexpected error: {e}")
+        return
+    
+    _precompile_pandas()
     
+    # Replace this launcher with Streamlit instead of idling as its parent;
+    # Streamlit handles Ctrl+C itself from here on
     try:
-        # Run Streamlit app
-        subprocess.run([sys.executable, "-m", "streamlit", "run", "app.py"], check=True)
-    except KeyboardInterrupt:
-        print("\n👋 Application stopped by user")
-    except subprocess.CalledProcessError as e:
+        os.execvp(cmd[0], cmd)
+    except OSError as e:
         print(f"❌ Error running application: {e}")
-    except Exception as e:
-        print(f"❌ Unexpected error: {e}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file